@@ -13,7 +13,8 @@
 # limitations under the License.
 """Tests for tfx.dsl.input_resolution.ops.latest_span_op."""
 
-from typing import Sequence
+import copy
+from typing import List, Sequence
 
 import tensorflow as tf
 from tfx import types
@@ -21,6 +22,12 @@ from tfx.dsl.input_resolution.ops import ops
 from tfx.dsl.input_resolution.ops import test_utils
 from tfx.types import artifact
 
+# Keys to sort the versions in a particular span.
+_VERSION_SORT_KEYS = (
+    'mlmd_artifact.create_time_since_epoch',
+    'id',
+)
+
 
 class ArtifactWithoutSpanOrVersion(types.Artifact):
   """An Artifact without "span" or "version" as a PROPERTY."""
@@ -38,41 +45,41 @@ class ArtifactWithoutSpan(types.Artifact):
   }
 
 
-class LatestSpanOpTest(tf.test.TestCase):
+class _LatestSpanOpTestMixin:
+  """Shared Context and helpers for LatestSpan test cases."""
+
+  @classmethod
+  def setUpClass(cls):
+    super().setUpClass()
+    # LatestSpan never reads from MLMD, so one Context serves every test.
+    cls._context = test_utils.make_strict_context()
+
+  def assertArtifactsAre(
+      self, actual: Sequence[types.Artifact], expected: Sequence[types.Artifact]
+  ):
+    """Asserts that actual holds exactly the expected artifact instances."""
+    self.assertLen(actual, len(expected))
+    for actual_artifact, expected_artifact in zip(actual, expected):
+      self.assertIs(actual_artifact, expected_artifact)
 
   def _latest_span(self, *args, **kwargs):
-    return test_utils.strict_run_resolver_op(
-        ops.LatestSpan, args=args, kwargs=kwargs
+    return test_utils.run_in_context(
+        self._context, ops.LatestSpan, args=args, kwargs=kwargs
     )
 
-  def _get_artifacts_for_rolling_range_tests(self) -> Sequence[types.Artifact]:
-    a10 = test_utils.DummyArtifact()
-    a20 = test_utils.DummyArtifact()
-    a31 = test_utils.DummyArtifact()
-    a30 = test_utils.DummyArtifact()
-    a71 = test_utils.DummyArtifact()
-    a82 = test_utils.DummyArtifact()
-
-    artifacts = [a10, a20, a31, a30, a71, a82]
-
-    spans = [1, 2, 3, 3, 7, 8]
-    versions = [0, 0, 1, 0, 1, 2]
-    for dummy_artifact, span, version in zip(artifacts, spans, versions):
-      dummy_artifact.span = span
-      dummy_artifact.version = version
 
-    return artifacts
+class LatestSpanOpBasicTest(_LatestSpanOpTestMixin, tf.test.TestCase):
 
   def testLatestSpan_Empty(self):
     actual = self._latest_span([])
-    self.assertEqual(actual, [])
+    self.assertArtifactsAre(actual, [])
 
   def testLatestSpan_SingleEntry(self):
     a1 = test_utils.DummyArtifact()
     a1.span = 1
 
     actual = self._latest_span([a1])
-    self.assertEqual(actual, [a1])
+    self.assertArtifactsAre(actual, [a1])
 
   def testLatestSpan_Simple(self):
     a1 = test_utils.DummyArtifact()
@@ -93,43 +100,24 @@ class LatestSpanOpTest(tf.test.TestCase):
     a4.version = 1
     a5.version = 1
 
-    artifacts = [a1, a2, a3, a4, a5, a6]
-
-    actual = self._latest_span(artifacts, n=1)
-    self.assertEqual(actual, [a4])
-
-    actual = self._latest_span(artifacts, n=2)
-    self.assertEqual(actual, [a3, a4])
-
-    actual = self._latest_span(artifacts, n=2, keep_all_versions=True)
-    self.assertEqual(actual, [a2, a3, a4])
-
-    actual = self._latest_span(artifacts, n=3)
-    self.assertEqual(actual, [a1, a3, a4])
-
-    actual = self._latest_span(
-        [a1, a2, a3, a4, a5], n=3, keep_all_versions=True
-    )
-    self.assertEqual(actual, [a1, a2, a3, a4])
-
-    actual = self._latest_span([a1, a2, a3, a4, a5], n=4)
-    self.assertEqual(actual, [a1, a3, a4])
-
-    actual = self._latest_span(
-        [a1, a2, a3, a4, a5], n=4, keep_all_versions=True
-    )
-    self.assertEqual(actual, [a1, a2, a3, a4])
-
-    actual = self._latest_span([a1, a2, a3, a4, a5], n=-1)
-    self.assertEqual(actual, [a1, a3, a4])
-
-    actual = self._latest_span([a1, a2, a3, a4, a5], n=-1)
-    self.assertEqual(actual, [a1, a3, a4])
-
-    actual = self._latest_span(
-        [a1, a2, a3, a4, a5], n=-1, keep_all_versions=True
-    )
-    self.assertEqual(actual, [a1, a2, a3, a4])
+    all_artifacts = [a1, a2, a3, a4, a5, a6]
+    artifacts = [a1, a2, a3, a4, a5]
+
+    cases = [
+        (all_artifacts, dict(n=1), [a4]),
+        (all_artifacts, dict(n=2), [a3, a4]),
+        (all_artifacts, dict(n=2, keep_all_versions=True), [a2, a3, a4]),
+        (all_artifacts, dict(n=3), [a1, a3, a4]),
+        (artifacts, dict(n=3, keep_all_versions=True), [a1, a2, a3, a4]),
+        (artifacts, dict(n=4), [a1, a3, a4]),
+        (artifacts, dict(n=4, keep_all_versions=True), [a1, a2, a3, a4]),
+        (artifacts, dict(n=-1), [a1, a3, a4]),
+        (artifacts, dict(n=-1, keep_all_versions=True), [a1, a2, a3, a4]),
+    ]
+    for inputs, kwargs, expected in cases:
+      with self.subTest(num_inputs=len(inputs), **kwargs):
+        actual = self._latest_span(inputs, **kwargs)
+        self.assertArtifactsAre(actual, expected)
 
   def testLatestSpan_AllSameSpanSameVersion(self):
     a1 = test_utils.DummyArtifact()
@@ -151,92 +139,104 @@ class LatestSpanOpTest(tf.test.TestCase):
     artifacts = [a1, a2, a3]
 
     actual = self._latest_span(artifacts, n=1)
-    self.assertEqual(actual, [a3])
+    self.assertArtifactsAre(actual, [a3])
 
     actual = self._latest_span(artifacts, n=1, keep_all_versions=True)
-    self.assertEqual(actual, [a1, a2, a3])
+    self.assertArtifactsAre(actual, [a1, a2, a3])
+
+
+class LatestSpanOpRollingRangeTest(
+    _LatestSpanOpTestMixin, tf.test.TestCase
+):
+
+  @classmethod
+  def setUpClass(cls):
+    super().setUpClass()
+    # (span, version) of the rolling range artifacts a10, a20, a31, a30, a71
+    # and a82, in that order.
+    cls._ROLLING_PROTOTYPES = ((1, 0), (2, 0), (3, 1), (3, 0), (7, 1), (8, 2))
+    cls._rolling_artifacts = cls._fresh_rolling_artifacts()
+
+  @classmethod
+  def _fresh_rolling_artifacts(cls) -> List[types.Artifact]:
+    artifacts = []
+    for span, version in cls._ROLLING_PROTOTYPES:
+      dummy_artifact = test_utils.DummyArtifact()
+      dummy_artifact.span = span
+      dummy_artifact.version = version
+      artifacts.append(dummy_artifact)
+    return artifacts
+
+  def _get_artifacts_for_rolling_range_tests(self) -> Sequence[types.Artifact]:
+    # LatestSpan does not mutate its inputs, so the artifacts are shared across
+    # tests. Tests that modify the artifacts must use _fresh_rolling_artifacts.
+    return copy.copy(self._rolling_artifacts)
 
   def testLatestSpan_SkipLastN(self):
     artifacts = self._get_artifacts_for_rolling_range_tests()
     a10, a20, a31, a30, a71, a82 = artifacts
 
-    actual = self._latest_span(artifacts)
-    self.assertEqual(actual, [a82])
-
-    actual = self._latest_span(artifacts, skip_last_n=1)
-    self.assertEqual(actual, [a71])
-
-    actual = self._latest_span(artifacts, skip_last_n=2)
-    self.assertEqual(actual, [a31])
-
-    # Tests version conflicts when keep_all_versions=False
-    actual = self._latest_span(artifacts, skip_last_n=2, n=2)
-    self.assertEqual(actual, [a20, a31])
-
-    # Tests version conflicts when keep_all_versions=True. Note that 3 artifacts
-    # are returned even when n=2, because n is the number of spans, NOT the
-    # number of artifacts to return.
-    actual = self._latest_span(
-        artifacts, skip_last_n=2, n=2, keep_all_versions=True
-    )
-    self.assertEqual(actual, [a20, a30, a31])
-
-    actual = self._latest_span(
-        artifacts, skip_last_n=2, n=3, keep_all_versions=True
-    )
-    self.assertEqual(actual, [a10, a20, a30, a31])
-
-    actual = self._latest_span(artifacts, skip_last_n=3, n=2)
-    self.assertEqual(actual, [a10, a20])
-
-    # skip_last_n=6 is larger than the number of artifacts with unique spans
-    # available.
-    actual = self._latest_span(artifacts, skip_last_n=6)
-    self.assertEqual(actual, [])
-
-    actual = self._latest_span(artifacts, skip_last_n=6, n=6)
-    self.assertEqual(actual, [])
-
-    # Test skip_last_n when n < 0.
-    actual = self._latest_span(artifacts, n=-1, skip_last_n=2)
-    self.assertEqual(actual, [a10, a20, a31])
-
-    actual = self._latest_span(
-        artifacts, n=-1, skip_last_n=2, keep_all_versions=True
-    )
-    self.assertEqual(actual, [a10, a20, a30, a31])
+    cases = [
+        (dict(), [a82]),
+        (dict(skip_last_n=1), [a71]),
+        (dict(skip_last_n=2), [a31]),
+        # Tests version conflicts when keep_all_versions=False
+        (dict(skip_last_n=2, n=2), [a20, a31]),
+        # Tests version conflicts when keep_all_versions=True. Note that 3
+        # artifacts are returned even when n=2, because n is the number of
+        # spans, NOT the number of artifacts to return.
+        (dict(skip_last_n=2, n=2, keep_all_versions=True), [a20, a30, a31]),
+        (
+            dict(skip_last_n=2, n=3, keep_all_versions=True),
+            [a10, a20, a30, a31],
+        ),
+        (dict(skip_last_n=3, n=2), [a10, a20]),
+        # skip_last_n=6 is larger than the number of artifacts with unique
+        # spans available.
+        (dict(skip_last_n=6), []),
+        (dict(skip_last_n=6, n=6), []),
+        # Test skip_last_n when n < 0.
+        (dict(n=-1, skip_last_n=2), [a10, a20, a31]),
+        (
+            dict(n=-1, skip_last_n=2, keep_all_versions=True),
+            [a10, a20, a30, a31],
+        ),
+    ]
+    for kwargs, expected in cases:
+      with self.subTest(**kwargs):
+        actual = self._latest_span(artifacts, **kwargs)
+        self.assertArtifactsAre(actual, expected)
 
   def testLatestSpan_MinSpan(self):
     artifacts = self._get_artifacts_for_rolling_range_tests()
     _, a20, a31, a30, a71, a82 = artifacts
 
-    # min_span=9 is greater than the largest span in artifacts, which is 8.
-    actual = self._latest_span(artifacts, min_span=9)
-    self.assertEqual(actual, [])
-
-    # Although n=3, there are only 2 artifacts with a span >= 7.
-    actual = self._latest_span(artifacts, min_span=7, n=3)
-    self.assertEqual(actual, [a71, a82])
-
-    # Tests version conflicts when keep_all_versions=False
-    actual = self._latest_span(artifacts, min_span=2, n=3)
-    self.assertEqual(actual, [a31, a71, a82])
-
-    # Tests version conflicts when keep_all_versions=True. Note that 5 artifacts
-    # are returned even when n=4, because n is the number of spans, NOT the
-    # number of artifacts to return.
-    actual = self._latest_span(
-        artifacts, min_span=2, n=4, keep_all_versions=True
-    )
-    self.assertEqual(actual, [a20, a30, a31, a71, a82])
-
-    actual = self._latest_span(
-        artifacts, min_span=2, n=5, keep_all_versions=True
-    )
-    self.assertEqual(actual, [a20, a30, a31, a71, a82])
+    cases = [
+        # min_span=9 is greater than the largest span in artifacts, which is 8.
+        (dict(min_span=9), []),
+        # Although n=3, there are only 2 artifacts with a span >= 7.
+        (dict(min_span=7, n=3), [a71, a82]),
+        # Tests version conflicts when keep_all_versions=False
+        (dict(min_span=2, n=3), [a31, a71, a82]),
+        # Tests version conflicts when keep_all_versions=True. Note that 5
+        # artifacts are returned even when n=4, because n is the number of
+        # spans, NOT the number of artifacts to return.
+        (
+            dict(min_span=2, n=4, keep_all_versions=True),
+            [a20, a30, a31, a71, a82],
+        ),
+        (
+            dict(min_span=2, n=5, keep_all_versions=True),
+            [a20, a30, a31, a71, a82],
+        ),
+    ]
+    for kwargs, expected in cases:
+      with self.subTest(**kwargs):
+        actual = self._latest_span(artifacts, **kwargs)
+        self.assertArtifactsAre(actual, expected)
 
   def testLatestSpan_CustomVersionSortKey(self):
-    rolling_range_artifacts = self._get_artifacts_for_rolling_range_tests()
+    rolling_range_artifacts = self._fresh_rolling_artifacts()
     a10, a20, a31, a30, _, _ = rolling_range_artifacts
 
     a11 = test_utils.DummyArtifact()
@@ -263,49 +263,42 @@ class LatestSpanOpTest(tf.test.TestCase):
 
     artifacts = [a11, a12, a13]
 
-    # Keys to sort the versions in a particular span.
-    # Empty key string should get filtered out and does nothing
-    version_sort_keys = (
-        'mlmd_artifact.create_time_since_epoch',
-        'id',
-    )
-
     actual = self._latest_span(
-        artifacts, n=1, version_sort_keys=version_sort_keys
+        artifacts, n=1, version_sort_keys=_VERSION_SORT_KEYS
     )
-    self.assertEqual(actual, [a12])
+    self.assertArtifactsAre(actual, [a12])
 
     a12.mlmd_artifact.create_time_since_epoch = 200
     actual = self._latest_span(
-        artifacts, n=1, version_sort_keys=version_sort_keys
+        artifacts, n=1, version_sort_keys=_VERSION_SORT_KEYS
     )
-    self.assertEqual(actual, [a13])
+    self.assertArtifactsAre(actual, [a13])
 
     actual = self._latest_span(
         artifacts,
         n=1,
         keep_all_versions=True,
-        version_sort_keys=version_sort_keys,
+        version_sort_keys=_VERSION_SORT_KEYS,
     )
-    self.assertEqual(actual, [a11, a12, a13])
+    self.assertArtifactsAre(actual, [a11, a12, a13])
 
     actual = self._latest_span(
         [*artifacts, *rolling_range_artifacts],
         n=3,
         skip_last_n=2,
         keep_all_versions=True,
-        version_sort_keys=version_sort_keys,
+        version_sort_keys=_VERSION_SORT_KEYS,
     )
-    self.assertEqual(actual, [a10, a11, a12, a13, a20, a30, a31])
+    self.assertArtifactsAre(actual, [a10, a11, a12, a13, a20, a30, a31])
 
     actual = self._latest_span(
         [*artifacts, *rolling_range_artifacts],
         n=3,
         skip_last_n=2,
         keep_all_versions=False,
-        version_sort_keys=version_sort_keys,
+        version_sort_keys=_VERSION_SORT_KEYS,
     )
-    self.assertEqual(actual, [a13, a20, a31])
+    self.assertArtifactsAre(actual, [a13, a20, a31])
 
   def testLatestSpan_EmptyVersionSortKey(self):
     with self.assertRaisesRegex(
@@ -322,38 +315,25 @@ class LatestSpanOpTest(tf.test.TestCase):
     artifacts = self._get_artifacts_for_rolling_range_tests()
     _, _, a31, a30, a71, _ = artifacts
 
-    actual = self._latest_span(
-        artifacts,
-        n=5,
-        skip_last_n=1,
-        min_span=3,
-        keep_all_versions=True,
-    )
-    self.assertEqual(actual, [a30, a31, a71])
-
-    actual = self._latest_span(
-        artifacts,
-        n=2,
-        skip_last_n=1,
-        min_span=3,
-        keep_all_versions=True,
-    )
-    self.assertEqual(actual, [a30, a31, a71])
-
-    actual = self._latest_span(
-        artifacts,
-        n=1,
-        skip_last_n=1,
-        min_span=3,
-        keep_all_versions=True,
-    )
-    self.assertEqual(actual, [a71])
-
-    actual = self._latest_span(
-        artifacts,
-        n=-1,
-        skip_last_n=2,
-        min_span=3,
-        keep_all_versions=True,
-    )
-    self.assertEqual(actual, [a30, a31])
+    cases = [
+        (
+            dict(n=5, skip_last_n=1, min_span=3, keep_all_versions=True),
+            [a30, a31, a71],
+        ),
+        (
+            dict(n=2, skip_last_n=1, min_span=3, keep_all_versions=True),
+            [a30, a31, a71],
+        ),
+        (
+            dict(n=1, skip_last_n=1, min_span=3, keep_all_versions=True),
+            [a71],
+        ),
+        (
+            dict(n=-1, skip_last_n=2, min_span=3, keep_all_versions=True),
+            [a30, a31],
+        ),
+    ]
+    for kwargs, expected in cases:
+      with self.subTest(**kwargs):
+        actual = self._latest_span(artifacts, **kwargs)
+        self.assertArtifactsAre(actual, expected)
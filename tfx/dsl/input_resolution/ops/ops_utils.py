@@ -14,7 +14,8 @@
 """Shared utility functions for ResolverOps."""
 
 import functools
-from typing import Dict, List, Optional, Sequence, Set
+import operator
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
 
 from tfx import types
 from tfx.orchestration.portable.input_resolution import exceptions
@@ -155,6 +156,25 @@ def get_valid_artifacts(
   return valid_artifacts
 
 
+@functools.lru_cache(maxsize=None)
+def _compile_version_sort_keys(
+    version_sort_keys: Tuple[str, ...],
+) -> Callable[[types.Artifact], Tuple[Any, ...]]:
+  """Returns a sort key function for the given version_sort_keys.
+
+  Nested keys like 'mlmd_artifact.create_time_since_epoch' are resolved as
+  getattr(getattr(artifact, 'mlmd_artifact'), 'create_time_since_epoch').
+
+  Args:
+    version_sort_keys: Tuple of string artifact attributes to sort by.
+
+  Returns:
+    A function mapping an artifact to a tuple of its attribute values.
+  """
+  getters = tuple(operator.attrgetter(k) for k in version_sort_keys)
+  return lambda a: tuple(getter(a) for getter in getters)
+
+
 def filter_artifacts_by_span(
     artifacts: List[types.Artifact],
     span_descending: bool,
@@ -214,15 +234,7 @@ def filter_artifacts_by_span(
     artifacts_by_span.setdefault(artifact.span, []).append(artifact)
 
   if version_sort_keys:
-    # Recursively resolve nested key attributes like
-    # 'mlmd_artifact.create_time_since_epoch' to the form
-    # getattr(getattr(artifact, 'mlmd_artifact'), 'create_time_since_epoch')
-    key = lambda a: (
-        tuple(
-            functools.reduce(getattr, k.split('.'), a)
-            for k in version_sort_keys
-        )
-    )
+    key = _compile_version_sort_keys(tuple(version_sort_keys))
   else:
     # span_descending only applies to sorting by span, but version should
     # always be sorted in ascending order. By default, latest version is defined
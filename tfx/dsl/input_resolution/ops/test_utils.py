@@ -395,15 +395,33 @@ def run_resolver_op(
   return op.apply(*arg)
 
 
-def strict_run_resolver_op(
+def make_strict_context(
+    store: Optional[mlmd.MetadataStore] = None,
+    mlmd_handle_like: Optional[mlmd_cm.HandleLike] = None,
+) -> resolver_op.Context:
+  """Creates a ResolverOp Context that can be shared by run_in_context calls."""
+  if mlmd_handle_like is not None:
+    mlmd_handle = mlmd_handle_like
+  else:
+    mlmd_handle = metadata.Metadata(
+        connection_config=metadata_store_pb2.ConnectionConfig(),
+    )
+    mlmd_handle._store = (  # pylint: disable=protected-access
+        store if store is not None else mock.MagicMock(spec=mlmd.MetadataStore)
+    )
+  return resolver_op.Context(
+      mlmd_handle_like=mlmd_handle,
+  )
+
+
+def run_in_context(
+    context: resolver_op.Context,
     op_type: Type[resolver_op.ResolverOp],
     *,
     args: Tuple[Any, ...],
     kwargs: Mapping[str, Any],
-    store: Optional[mlmd.MetadataStore] = None,
-    mlmd_handle_like: Optional[mlmd_cm.HandleLike] = None,
 ):
-  """Runs ResolverOp with strict type checking."""
+  """Runs ResolverOp in the given Context with strict type checking."""
   if len(args) != len(op_type.arg_data_types):
     raise TypeError(
         f'len({op_type}.arg_data_types) = {len(op_type.arg_data_types)} but'
@@ -425,19 +443,6 @@ def strict_run_resolver_op(
               f'Expected ARTIFACT_MULTIMAP_LIST but arg[{i}] = {arg}'
           )
   op = op_type.create(**kwargs)
-
-  if mlmd_handle_like is not None:
-    mlmd_handle = mlmd_handle_like
-  else:
-    mlmd_handle = metadata.Metadata(
-        connection_config=metadata_store_pb2.ConnectionConfig(),
-    )
-    mlmd_handle._store = (  # pylint: disable=protected-access
-        store if store is not None else mock.MagicMock(spec=mlmd.MetadataStore)
-    )
-  context = resolver_op.Context(
-      mlmd_handle_like=mlmd_handle,
-  )
   op.set_context(context)
   result = op.apply(*args)
   if op_type.return_data_type == resolver_op.DataType.ARTIFACT_LIST:
@@ -452,3 +457,20 @@ def strict_run_resolver_op(
           f'Expected ARTIFACT_MULTIMAP_LIST result but got {result}'
       )
   return result
+
+
+def strict_run_resolver_op(
+    op_type: Type[resolver_op.ResolverOp],
+    *,
+    args: Tuple[Any, ...],
+    kwargs: Mapping[str, Any],
+    store: Optional[mlmd.MetadataStore] = None,
+    mlmd_handle_like: Optional[mlmd_cm.HandleLike] = None,
+):
+  """Runs ResolverOp with strict type checking."""
+  return run_in_context(
+      make_strict_context(store=store, mlmd_handle_like=mlmd_handle_like),
+      op_type,
+      args=args,
+      kwargs=kwargs,
+  )
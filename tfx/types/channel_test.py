@@ -14,8 +14,11 @@
 """Tests for tfx.utils.channel."""
 
 
+import copy
+import functools
+from typing import Any, Dict
+
 import pytest
-from unittest import mock
 
 import tensorflow as tf
 from tfx.dsl.components.base.testing import test_node
@@ -43,6 +46,75 @@ class _AnotherType(artifact.Artifact):
   TYPE_NAME = 'AnotherTypeName'
 
 
+class _Producer:
+  """Minimal producer stub; channels only read the producer's `id`."""
+
+  __slots__ = ('id',)
+
+  def __init__(self, node_id: str):
+    self.id = node_id
+
+
+def _make_proto_property() -> metadata_store_pb2.Value:
+  proto_property = metadata_store_pb2.Value()
+  proto_property.proto_value.Pack(
+      struct_pb2.Value(string_value='proto-string-val'))
+  return proto_property
+
+
+@functools.lru_cache(maxsize=None)
+def _get_expected_channel() -> channel.Channel:
+  """Returns the JSON round-trip channel, built on first use."""
+  return channel.Channel(
+      type=_MyType,
+      additional_properties={
+          'string_value': metadata_store_pb2.Value(string_value='forty-two'),
+          'proto_value': _make_proto_property(),
+      },
+      additional_custom_properties={
+          'int_value': metadata_store_pb2.Value(int_value=42)
+      })
+
+
+@functools.lru_cache(maxsize=None)
+def _get_expected_serialized() -> Dict[str, Any]:
+  """Returns the serialized round-trip channel; callers must deep copy it."""
+  return _get_expected_channel().to_json_dict()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_channels() -> Dict[str, channel.BaseChannel]:
+  """Returns channels of each kind, built once; tests must not mutate them."""
+  x1 = _Producer('x1')
+  x2 = _Producer('x2')
+  p = _Producer('p')
+
+  just_channel = channel.Channel(type=_MyType)
+  output_channel_x1 = channel.OutputChannel(
+      artifact_type=_MyType, producer_component=x1,
+      output_key='out1')
+  output_channel_x2 = channel.OutputChannel(
+      artifact_type=_MyType, producer_component=x2,
+      output_key='out1')
+  pipeline_input_channel = channel.PipelineInputChannel(
+      output_channel_x1, output_key='out2')
+  pipeline_output_channel = channel.PipelineOutputChannel(
+      output_channel_x2, p, output_key='out3')
+  pipeline_input_channel.pipeline = p
+  union_channel = channel.union([output_channel_x1, output_channel_x2])
+  resolved_channel_ = resolved_channel.ResolvedChannel(
+      _MyType, resolver_op.InputNode(union_channel))
+  return {
+      'just_channel': just_channel,
+      'output_x1': output_channel_x1,
+      'output_x2': output_channel_x2,
+      'pipeline_input': pipeline_input_channel,
+      'pipeline_output': pipeline_output_channel,
+      'union': union_channel,
+      'resolved': resolved_channel_,
+  }
+
+
 class ChannelTest(tf.test.TestCase):
 
   def testValidChannel(self):
@@ -61,20 +133,9 @@ class ChannelTest(tf.test.TestCase):
   @pytest.mark.xfail(run=False, reason="PR 6889 This test fails and needs to be fixed. "
 "If this test passes, please remove this mark.", strict=True)
   def testJsonRoundTrip(self):
-    proto_property = metadata_store_pb2.Value()
-    proto_property.proto_value.Pack(
-        struct_pb2.Value(string_value='proto-string-val'))
-    chnl = channel.Channel(
-        type=_MyType,
-        additional_properties={
-            'string_value': metadata_store_pb2.Value(string_value='forty-two'),
-            'proto_value': proto_property,
-        },
-        additional_custom_properties={
-            'int_value': metadata_store_pb2.Value(int_value=42)
-        })
-    serialized = chnl.to_json_dict()
-    rehydrated = channel.Channel.from_json_dict(serialized)
+    chnl = _get_expected_channel()
+    rehydrated = channel.Channel.from_json_dict(
+        copy.deepcopy(_get_expected_serialized()))
     self.assertIs(chnl.type, rehydrated.type)
     self.assertEqual(chnl.type_name, rehydrated.type_name)
     self.assertEqual(chnl.additional_properties,
@@ -111,8 +172,7 @@ class ChannelTest(tf.test.TestCase):
   def testFuturePlaceholderEquality(self):
     # The Cond() implementation in CondContext::validate() relies on placeholder
     # equality (and non-equality).
-    producer = mock.MagicMock()
-    producer.id = 'x1'
+    producer = _Producer('x1')
     future1 = channel.OutputChannel(
         artifact_type=_MyType, producer_component=producer, output_key='output1'
     ).future()
@@ -155,8 +215,7 @@ class ChannelTest(tf.test.TestCase):
       channel.union([])
 
   def testAsOutputChannel(self):
-    node1 = mock.MagicMock()
-    node1.id = 'n1'
+    node1 = _Producer('n1')
     ch1 = channel.Channel(type=_MyType)
     ch1.additional_properties['string_value'] = 'foo'
     ch1.additional_custom_properties['another_string_value'] = 'bar'
@@ -178,28 +237,7 @@ class ChannelTest(tf.test.TestCase):
                        {'another_string_value': 'bar2'})
 
   def testGetDataDependentNodeIds(self):
-    x1 = mock.MagicMock()
-    x1.id = 'x1'
-    x2 = mock.MagicMock()
-    x2.id = 'x2'
-    p = mock.MagicMock()
-    p.id = 'p'
-
-    just_channel = channel.Channel(type=_MyType)
-    output_channel_x1 = channel.OutputChannel(
-        artifact_type=_MyType, producer_component=x1,
-        output_key='out1')
-    output_channel_x2 = channel.OutputChannel(
-        artifact_type=_MyType, producer_component=x2,
-        output_key='out1')
-    pipeline_input_channel = channel.PipelineInputChannel(
-        output_channel_x1, output_key='out2')
-    pipeline_output_channel = channel.PipelineOutputChannel(
-        output_channel_x2, p, output_key='out3')
-    pipeline_input_channel.pipeline = p
-    union_channel = channel.union([output_channel_x1, output_channel_x2])
-    resolved_channel_ = resolved_channel.ResolvedChannel(
-        _MyType, resolver_op.InputNode(union_channel))
+    chs = _get_channels()
 
     def check(ch, expected):
       with self.subTest(channel_type=type(ch).__name__):
@@ -207,17 +245,16 @@ class ChannelTest(tf.test.TestCase):
         self.assertCountEqual(
             actual, expected, f'Expected {expected} but got {actual}.')
 
-    check(just_channel, [])
-    check(output_channel_x1, ['x1'])
-    check(output_channel_x2, ['x2'])
-    check(pipeline_input_channel, ['p'])
-    check(pipeline_output_channel, ['p'])
-    check(union_channel, ['x1', 'x2'])
-    check(resolved_channel_, ['x1', 'x2'])
+    check(chs['just_channel'], [])
+    check(chs['output_x1'], ['x1'])
+    check(chs['output_x2'], ['x2'])
+    check(chs['pipeline_input'], ['p'])
+    check(chs['pipeline_output'], ['p'])
+    check(chs['union'], ['x1', 'x2'])
+    check(chs['resolved'], ['x1', 'x2'])
 
   def testChannelAsOptionalChannel(self):
-    x1 = mock.MagicMock()
-    x1.id = 'x1'
+    x1 = _Producer('x1')
     required_output_channel = channel.OutputChannel(
         artifact_type=_MyType, producer_component=x1, output_key='out1'
     )